@@ -4,10 +4,10 @@ from lox_token import Token, TokenType
 
 
 class Expr:
-    pass
+    __slots__ = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Binary(Expr):
     left: Expr
     operator: Token
@@ -17,7 +17,7 @@ class Binary(Expr):
         return f"({self.operator.lexeme} {self.left} {self.right})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Grouping(Expr):
     expression: Expr
 
@@ -25,7 +25,7 @@ class Grouping(Expr):
         return f"(group {self.expression})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Literal(Expr):
     value: object
 
@@ -35,7 +35,7 @@ class Literal(Expr):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Unary(Expr):
     operator: Token
     right: Expr
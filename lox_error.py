@@ -0,0 +1,15 @@
+import sys
+
+
+class ErrorHandler:
+
+    def __init__(self) -> None:
+        self._had_error = False
+
+    def error(self, line: int, message: str, where: str = ''):
+        print(f"[Line {line}] Error {where}: {message}", file=sys.stderr)
+        self._had_error = True
+
+    @property
+    def had_error(self):
+        return self._had_error
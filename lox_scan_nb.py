@@ -0,0 +1,222 @@
+from array import array
+
+import numba
+import numpy as np
+
+from lox_error import ErrorHandler
+from lox_scanner import Scanner as _PyScanner
+from lox_token import TokenList, TokenType
+
+
+# token codes are TokenType values, negative codes flag scan errors
+_UNEXPECTED_CHARACTER = -1
+_UNTERMINATED_STRING = -2
+_INVALID_STRING = -3
+
+_SLASH = TokenType.SLASH.value
+_IDENTIFIER = TokenType.IDENTIFIER.value
+_STRING = TokenType.STRING.value
+_NUMBER = TokenType.NUMBER.value
+_EOF = TokenType.EOF.value
+
+
+def _byte_table(tokens: dict[int, TokenType]) -> np.ndarray:
+    # TokenType values start at 1, so 0 marks bytes that are not in the table
+    table = np.zeros(256, dtype=np.int8)
+    for code, type_ in tokens.items():
+        table[code] = type_
+    return table
+
+
+# global arrays are frozen into the compiled kernel as constants, built from
+# the pure-Python scanner's tables so the two backends cannot drift apart
+_SINGLE_CHAR_CODES = _byte_table(_PyScanner.SINGLE_CHAR_TOKENS)
+_OP_SINGLE_CODES = _byte_table({code: op.single for code, op in _PyScanner.OP_TOKENS.items()})
+_OP_EQUAL_CODES = _byte_table({code: op.with_equal for code, op in _PyScanner.OP_TOKENS.items()})
+
+
+def _kw_hash(length: int, first: int, last: int, size: int) -> int:
+    return (length * 31 + first * 7 + last) % size
+
+
+def _build_kw_table() -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    keywords = _PyScanner.KEYWORDS
+    # smallest table in which every keyword gets its own slot
+    size = len(keywords)
+    while len({_kw_hash(len(kw), kw[0], kw[-1], size) for kw in keywords}) < len(keywords):
+        size += 1
+
+    width = max(len(kw) for kw in keywords)
+    slots = np.full(size, -1, dtype=np.int8)
+    words = np.zeros((len(keywords), width), dtype=np.uint8)
+    lengths = np.zeros(len(keywords), dtype=np.int8)
+    codes = np.zeros(len(keywords), dtype=np.int8)
+    for i, (kw, type_) in enumerate(keywords.items()):
+        slots[_kw_hash(len(kw), kw[0], kw[-1], size)] = i
+        words[i, :len(kw)] = np.frombuffer(kw, dtype=np.uint8)
+        lengths[i] = len(kw)
+        codes[i] = type_
+    return slots, words, lengths, codes
+
+
+_KW_SLOTS, _KW_WORDS, _KW_LENGTHS, _KW_CODES = _build_kw_table()
+_KW_SIZE = len(_KW_SLOTS)
+_KW_MAX_LENGTH = _KW_WORDS.shape[1]
+
+
+@numba.njit(cache=True)
+def _is_digit(c):
+    return 48 <= c <= 57
+
+
+@numba.njit(cache=True)
+def _is_alpha(c):
+    return (97 <= c <= 122) or (65 <= c <= 90) or c == 95
+
+
+@numba.njit(cache=True)
+def _identifier_code(buf, start, end):
+    length = end - start
+    if length > _KW_MAX_LENGTH:
+        return _IDENTIFIER
+    slot = _KW_SLOTS[(length * 31 + int(buf[start]) * 7 + int(buf[end - 1])) % _KW_SIZE]
+    if slot < 0 or _KW_LENGTHS[slot] != length:
+        return _IDENTIFIER
+    for i in range(length):
+        if buf[start + i] != _KW_WORDS[slot, i]:
+            return _IDENTIFIER
+    return _KW_CODES[slot]
+
+
+@numba.njit(cache=True)
+def scan(buf):
+    n = len(buf)
+    # every token consumes at least one byte, plus one slot for EOF; intc
+    # matches array('i') so the offsets copy over as raw bytes
+    types = np.empty(n + 1, dtype=np.int8)
+    starts = np.empty(n + 1, dtype=np.intc)
+    ends = np.empty(n + 1, dtype=np.intc)
+    lines = np.empty(n + 1, dtype=np.intc)
+
+    count = 0
+    line = 1
+    current = 0
+    while current < n:
+        start = current
+        c = buf[current]
+        current += 1
+
+        if _SINGLE_CHAR_CODES[c] != 0:
+            code = _SINGLE_CHAR_CODES[c]
+        elif _OP_SINGLE_CODES[c] != 0:
+            if current < n and buf[current] == 61:  # =
+                current += 1
+                code = _OP_EQUAL_CODES[c]
+            else:
+                code = _OP_SINGLE_CODES[c]
+        elif c == 47:  # /
+            if current < n and buf[current] == 47:
+                # within a comment
+                while current < n and buf[current] != 10:
+                    current += 1
+                continue
+            code = _SLASH
+        elif c == 32 or c == 9 or c == 13:
+            continue
+        elif c == 10:
+            line += 1
+            continue
+        elif c == 34:  # "
+            while current < n and buf[current] != 34:
+                if buf[current] == 10:
+                    line += 1
+                current += 1
+            if current >= n:
+                code = _UNTERMINATED_STRING
+            else:
+                # consume closing "
+                current += 1
+                code = _STRING
+        elif _is_digit(c):
+            while current < n and _is_digit(buf[current]):
+                current += 1
+            if current + 1 < n and buf[current] == 46 and _is_digit(buf[current + 1]):
+                # consume .
+                current += 1
+                while current < n and _is_digit(buf[current]):
+                    current += 1
+            code = _NUMBER
+        elif _is_alpha(c):
+            while current < n and (_is_alpha(buf[current]) or _is_digit(buf[current])):
+                current += 1
+            code = _identifier_code(buf, start, current)
+        else:
+            # one error per non-ASCII character, or per run of stray
+            # continuation bytes
+            while c >= 0x80 and current < n and (buf[current] & 0xC0) == 0x80:
+                current += 1
+            code = _UNEXPECTED_CHARACTER
+
+        types[count] = code
+        starts[count] = start
+        ends[count] = current
+        lines[count] = line
+        count += 1
+
+    types[count] = _EOF
+    starts[count] = n
+    ends[count] = n
+    lines[count] = line
+    count += 1
+
+    return types[:count], starts[:count], ends[:count], lines[:count]
+
+
+def _to_array(typecode: str, values: np.ndarray) -> array:
+    result = array(typecode)
+    # a single copy, straight from the NumPy buffer
+    result.frombytes(values.data.cast('B'))
+    return result
+
+
+class Scanner:
+    """Drop-in replacement for lox_scanner.Scanner backed by the Numba kernel."""
+
+    def __init__(self, source: bytes, error_handler: ErrorHandler) -> None:
+        self._source = source
+        self._error_handler = error_handler
+
+    def scan_tokens(self) -> TokenList:
+        source = self._source
+        types, starts, ends, lines = scan(np.frombuffer(source, dtype=np.uint8))
+        literals: list[object] = [None] * len(types)
+
+        # errors and string values need Python, walk those entries in source
+        # order so errors are reported as the pure-Python scanner would
+        for index in np.flatnonzero((types < 0) | (types == _STRING)).tolist():
+            code = types[index]
+            line = int(lines[index])
+            if code == _UNEXPECTED_CHARACTER:
+                self._error_handler.error(line=line, message="Unexpected character")
+            elif code == _UNTERMINATED_STRING:
+                self._error_handler.error(line=line, message="Unterminated string.")
+            else:
+                try:
+                    literals[index] = source[starts[index] + 1: ends[index] - 1].decode('utf-8')
+                except UnicodeDecodeError:
+                    self._error_handler.error(line=line, message="Invalid UTF-8 in string.")
+                    types[index] = _INVALID_STRING
+
+        keep = types >= 0
+        if not keep.all():
+            types, starts, ends, lines = types[keep], starts[keep], ends[keep], lines[keep]
+            literals = [literal for literal, kept in zip(literals, keep.tolist()) if kept]
+
+        return TokenList(
+            source,
+            _to_array('b', types),
+            _to_array('i', starts),
+            _to_array('i', ends),
+            _to_array('i', lines),
+            literals,
+        )
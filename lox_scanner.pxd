@@ -0,0 +1,22 @@
+# Cython declarations for lox_scanner.py. The module runs as plain Python;
+# compiling it is optional and only needs:
+#
+#     cythonize -i lox_scanner.py
+
+cimport cython
+
+
+cdef class Scanner:
+    cdef:
+        bytes _text, _source
+        object _error_handler
+        object _types, _starts, _ends, _lines
+        list _literals
+        Py_ssize_t _source_len, _start, _current, _line
+        Py_ssize_t _capacity, _ntokens
+        list _dispatch
+
+    cdef inline bint _match(self, int exp)
+
+    @cython.locals(source=bytes, source_len=Py_ssize_t, dispatch=list)
+    cpdef scan_tokens(self)
@@ -0,0 +1,230 @@
+import re
+from array import array
+from collections.abc import Callable
+from functools import partial
+from typing import NamedTuple
+
+from lox_error import ErrorHandler
+from lox_token import TokenList, TokenType
+
+
+# the character predicates take a byte value (0-255) and trust the caller,
+# there are no length, type or range checks
+def _is_ascii_digit(code: int) -> bool:
+    # 0-9
+    return 48 <= code <= 57
+
+
+def _is_ascii_alpha(code: int) -> bool:
+    # a-z, A-Z, _
+    return (97 <= code <= 122) or (65 <= code <= 90) or code == 95
+
+
+_NUMBER_RE = re.compile(rb'[0-9]+(?:\.[0-9]+)?')
+_IDENTIFIER_RE = re.compile(rb'[A-Za-z_][A-Za-z0-9_]*')
+
+
+class OpTokenPair(NamedTuple):
+    with_equal: TokenType
+    single: TokenType
+
+
+class Scanner:
+
+    SINGLE_CHAR_TOKENS = {
+        ord('('): TokenType.LEFT_PAREN,
+        ord(')'): TokenType.RIGHT_PAREN,
+        ord('{'): TokenType.LEFT_BRACE,
+        ord('}'): TokenType.RIGHT_BRACE,
+        ord(','): TokenType.COMMA,
+        ord('.'): TokenType.DOT,
+        ord('-'): TokenType.MINUS,
+        ord('+'): TokenType.PLUS,
+        ord(';'): TokenType.SEMICOLON,
+        ord('*'): TokenType.STAR,
+    }
+
+    OP_TOKENS = {
+        ord('!'): OpTokenPair(with_equal=TokenType.BANG_EQUAL, single=TokenType.BANG),
+        ord('='): OpTokenPair(with_equal=TokenType.EQUAL_EQUAL, single=TokenType.EQUAL),
+        ord('<'): OpTokenPair(with_equal=TokenType.LESS_EQUAL, single=TokenType.LESS),
+        ord('>'): OpTokenPair(with_equal=TokenType.GREATER_EQUAL, single=TokenType.GREATER),
+    }
+
+    KEYWORDS = {
+        b"and": TokenType.AND,
+        b"class": TokenType.CLASS, 
+        b"else": TokenType.ELSE,
+        b"false": TokenType.FALSE, 
+        b"fun": TokenType.FUN, 
+        b"for": TokenType.FOR, 
+        b"if": TokenType.IF,
+        b"nil": TokenType.NIL,
+        b"or": TokenType.OR,
+        b"print": TokenType.PRINT, 
+        b"return": TokenType.RETURN,
+        b"super": TokenType.SUPER,
+        b"this": TokenType.THIS,
+        b"true": TokenType.TRUE,
+        b"var": TokenType.VAR,
+        b"while": TokenType.WHILE, 
+    }
+
+    def __init__(self, source: bytes, error_handler: ErrorHandler) -> None:
+        # the trailing NUL sentinel keeps self._source[self._current] in range
+        # at the end of input, so lookahead needs no bounds check; the tokens
+        # keep the original source without it
+        self._text = source
+        self._source = source + b'\0'
+        self._source_len = len(source)
+        self._error_handler = error_handler
+        # tokens are kept as parallel arrays, see TokenList, sized up front
+        # and filled by index so they rarely need to grow
+        self._capacity = len(source) // 3 + 16
+        self._ntokens = 0
+        self._types = array('b', bytes(self._capacity))
+        self._starts = array('i', [0]) * self._capacity
+        self._ends = array('i', [0]) * self._capacity
+        self._lines = array('i', [0]) * self._capacity
+        self._literals: list[object] = [None] * self._capacity
+        self._start = 0
+        self._current = 0
+        self._line = 1
+        self._dispatch = self._build_dispatch()
+
+    def _match(self, exp) -> bool:
+        # conditional advance
+        if self._source[self._current] != exp:
+            return False
+        self._current += 1
+        return True
+
+    def _grow(self) -> None:
+        extra = self._capacity
+        self._types.frombytes(bytes(extra))
+        self._starts.extend(array('i', [0]) * extra)
+        self._ends.extend(array('i', [0]) * extra)
+        self._lines.extend(array('i', [0]) * extra)
+        self._literals.extend([None] * extra)
+        self._capacity += extra
+
+    def _add_token(self, type_: TokenType, literal: object = None) -> None:
+        index = self._ntokens
+        if index == self._capacity:
+            self._grow()
+        self._types[index] = type_
+        self._starts[index] = self._start
+        self._ends[index] = self._current
+        self._lines[index] = self._line
+        if literal is not None:
+            self._literals[index] = literal
+        self._ntokens = index + 1
+    
+    def _build_dispatch(self) -> list[Callable[[], None]]:
+        # one scanning routine per byte value
+        dispatch: list[Callable[[], None]] = [self._scan_unexpected] * 256
+        for code, type_ in self.SINGLE_CHAR_TOKENS.items():
+            dispatch[code] = partial(self._add_token, type_)
+        for code, op_token in self.OP_TOKENS.items():
+            dispatch[code] = partial(self._scan_op, op_token)
+        for code in range(128):
+            if _is_ascii_digit(code):
+                dispatch[code] = self._scan_number
+            elif _is_ascii_alpha(code):
+                dispatch[code] = self._scan_identifier
+        for code in range(0x80, 0x100):
+            dispatch[code] = self._scan_non_ascii
+        dispatch[ord(' ')] = self._skip
+        dispatch[ord('\t')] = self._skip
+        dispatch[ord('\r')] = self._skip
+        dispatch[ord('\n')] = self._scan_newline
+        dispatch[ord('/')] = self._scan_slash
+        dispatch[ord('"')] = self._scan_string
+        return dispatch
+
+    def _skip(self) -> None:
+        pass
+
+    def _scan_unexpected(self) -> None:
+        self._error_handler.error(line=self._line, message="Unexpected character")
+
+    def _scan_non_ascii(self) -> None:
+        # non-ASCII characters are only valid inside strings; report one error
+        # per character, or per run of stray continuation bytes, by skipping
+        # the continuation bytes that follow (the sentinel ends the run)
+        source = self._source
+        while 0x80 <= source[self._current] < 0xC0:
+            self._current += 1
+        self._error_handler.error(line=self._line, message="Unexpected character")
+
+    def _scan_newline(self) -> None:
+        self._line += 1
+
+    def _scan_op(self, op_token: OpTokenPair) -> None:
+        self._add_token(op_token.with_equal if self._match(ord('=')) else op_token.single)
+
+    def _scan_slash(self) -> None:
+        if self._match(ord('/')):
+            # skip the comment up to, but not including, the newline
+            newline = self._source.find(b'\n', self._current)
+            self._current = newline if newline != -1 else self._source_len
+        else:
+            self._add_token(TokenType.SLASH)
+
+    def _scan_string(self) -> None:
+        end = self._source.find(b'"', self._current)
+        if end == -1:
+            self._line += self._source.count(b'\n', self._current)
+            self._current = self._source_len
+            self._error_handler.error(line=self._line, message="Unterminated string.")
+            return
+
+        self._line += self._source.count(b'\n', self._current, end)
+        # consume closing "
+        self._current = end + 1
+
+        # get value with trimmed quotes
+        body = self._source[self._start + 1: end]
+        # the only place non-ASCII source is accepted
+        try:
+            value = body.decode('utf-8')
+        except UnicodeDecodeError:
+            self._error_handler.error(line=self._line, message="Invalid UTF-8 in string.")
+            return
+        self._add_token(TokenType.STRING, value)
+
+    def _scan_number(self) -> None:
+        # dispatched on a digit, so the pattern always matches
+        match = _NUMBER_RE.match(self._source, self._start)
+        assert match is not None
+        self._current = match.end()
+        # the value is parsed from the lexeme when first read, see TokenView
+        self._add_token(TokenType.NUMBER)
+
+    def _scan_identifier(self) -> None:
+        # dispatched on a letter or underscore, so the pattern always matches
+        match = _IDENTIFIER_RE.match(self._source, self._start)
+        assert match is not None
+        self._current = match.end()
+        # hashing a short bytes key beats pre-filtering on its length and bytes
+        text = self._source[self._start: self._current]
+        self._add_token(self.KEYWORDS.get(text, TokenType.IDENTIFIER))
+
+    def scan_tokens(self) -> TokenList:
+        # hoisted out of the loop so each character costs only local loads
+        source = self._source
+        source_len = self._source_len
+        dispatch = self._dispatch
+        while self._current < source_len:
+            self._start = self._current
+            self._current += 1
+            dispatch[source[self._start]]()
+
+        self._start = self._current
+        self._add_token(TokenType.EOF)
+
+        # trim the unused capacity in place rather than copying
+        count = self._ntokens
+        del self._types[count:], self._starts[count:], self._ends[count:], self._lines[count:]
+        del self._literals[count:]
+        return TokenList(self._text, self._types, self._starts, self._ends, self._lines, self._literals)
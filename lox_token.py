@@ -1,8 +1,11 @@
 import enum
-from dataclasses import dataclass
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
+from typing import cast, overload
 
 
-class TokenType(enum.Enum):
+class TokenType(enum.IntEnum):
     # Single character tokens
     LEFT_PAREN = enum.auto()
     RIGHT_PAREN = enum.auto()
@@ -52,9 +55,138 @@ class TokenType(enum.Enum):
     EOF = enum.auto()
 
 
-@dataclass(frozen=True)
+# TokenType by value, indexing this is far cheaper than calling TokenType();
+# values start at 1, so slot 0 is never read
+_TOKEN_TYPES = cast(tuple[TokenType, ...], (None, *TokenType))
+
+
 class Token:
-    type: TokenType
-    lexeme: str
-    literal: object
-    line: int
+
+    __slots__ = ('type', 'lexeme', 'literal', 'line')
+
+    def __init__(self, type: TokenType, lexeme: str, literal: object, line: int) -> None:
+        self.type = type
+        self.lexeme = lexeme
+        self.literal = literal
+        self.line = line
+
+    def __repr__(self) -> str:
+        return f"Token(type={self.type!r}, lexeme={self.lexeme!r}, literal={self.literal!r}, line={self.line!r})"
+
+
+# token types whose lexeme is not determined by the type alone
+_VARYING_LEXEME_TYPES = frozenset({
+    TokenType.IDENTIFIER,
+    TokenType.STRING,
+    TokenType.NUMBER,
+})
+
+
+class TokenList(Sequence['Token | TokenView']):
+    """Tokens stored as parallel arrays, one entry per token."""
+
+    __slots__ = ('source', 'types', 'starts', 'ends', 'lines', 'literals', '_cache')
+
+    def __init__(
+        self,
+        source: bytes,
+        types: array,
+        starts: array,
+        ends: array,
+        lines: array,
+        literals: list[object],
+    ) -> None:
+        self.source = source
+        self.types = types
+        self.starts = starts
+        self.ends = ends
+        self.lines = lines
+        self.literals = literals
+        self._cache: list[Token | None] = [None] * len(types)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    @overload
+    def __getitem__(self, index: int) -> 'Token | TokenView': ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list['Token | TokenView']: ...
+
+    def __getitem__(self, index: int | slice) -> 'Token | TokenView | list[Token | TokenView]':
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(len(self.types)))]
+        if index < 0:
+            index += len(self.types)
+        if not 0 <= index < len(self.types):
+            raise IndexError("token index out of range")
+        return self._entry(index)
+
+    def __iter__(self) -> Iterator['Token | TokenView']:
+        # walk the indices directly rather than through Sequence's
+        # __getitem__/IndexError protocol
+        entry = self._entry
+        for index in range(len(self.types)):
+            yield entry(index)
+
+    def _entry(self, index: int) -> 'Token | TokenView':
+        type_ = self.types[index]
+        if type_ in _VARYING_LEXEME_TYPES:
+            return TokenView(self, index)
+
+        # punctuation, operators and keywords are built once per position, so
+        # reading an entry again returns the same Token and equality stays
+        # positional, as it is for TokenView
+        token = self._cache[index]
+        if token is None:
+            lexeme = self.source[self.starts[index]: self.ends[index]].decode('utf-8')
+            token = Token(type=_TOKEN_TYPES[type_], lexeme=lexeme, literal=None, line=self.lines[index])
+            self._cache[index] = token
+        return token
+
+
+class TokenView:
+    """Read-only view of a single token in a TokenList."""
+
+    __slots__ = ('_tokens', '_index')
+
+    def __init__(self, tokens: TokenList, index: int) -> None:
+        self._tokens = tokens
+        self._index = index
+
+    @property
+    def type(self) -> TokenType:
+        return _TOKEN_TYPES[self._tokens.types[self._index]]
+
+    @property
+    def lexeme(self) -> str:
+        tokens = self._tokens
+        text = tokens.source[tokens.starts[self._index]: tokens.ends[self._index]].decode('utf-8')
+        if tokens.types[self._index] == TokenType.IDENTIFIER:
+            # repeated identifiers collapse to one string object
+            return sys.intern(text)
+        return text
+
+    @property
+    def literal(self) -> object:
+        tokens = self._tokens
+        literal = tokens.literals[self._index]
+        if literal is None and tokens.types[self._index] == TokenType.NUMBER:
+            literal = float(tokens.source[tokens.starts[self._index]: tokens.ends[self._index]])
+            tokens.literals[self._index] = literal
+        return literal
+
+    @property
+    def line(self) -> int:
+        return self._tokens.lines[self._index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TokenView):
+            return NotImplemented
+        return self._tokens is other._tokens and self._index == other._index
+
+    def __hash__(self) -> int:
+        return hash((id(self._tokens), self._index))
+
+    def __repr__(self) -> str:
+        return f"Token(type={self.type!r}, lexeme={self.lexeme!r}, literal={self.literal!r}, line={self.line!r})"
@@ -0,0 +1,136 @@
+import contextlib
+import io
+import unittest
+
+from lox_error import ErrorHandler
+from lox_scanner import Scanner
+from lox_token import TokenList, TokenType
+
+try:
+    import lox_scan_nb
+except ImportError:
+    lox_scan_nb = None  # type: ignore[assignment]
+
+
+SAMPLE = b"""// comment
+var a = 1.5;
+fun f(x) { return x >= 2 and !(x == 3) or x > 4 and x != 5 and x <= 6; }
+print "multi
+line" + "caf\xc3\xa9";
+class A < B { init() { this.y = super.z; } }
+12. .5 @ \xc3\xa9
+"unterminated
+"""
+
+
+def _scan(source: bytes, scanner: type = Scanner) -> tuple[TokenList, ErrorHandler]:
+    error_handler = ErrorHandler()
+    with contextlib.redirect_stderr(io.StringIO()):
+        tokens = scanner(source, error_handler=error_handler).scan_tokens()
+    return tokens, error_handler
+
+
+class ScannerTest(unittest.TestCase):
+
+    def test_greater_operators(self):
+        tokens, _ = _scan(b'> >= ! !=')
+        self.assertEqual(
+            [t.type for t in tokens],
+            [TokenType.GREATER, TokenType.GREATER_EQUAL, TokenType.BANG, TokenType.BANG_EQUAL, TokenType.EOF],
+        )
+
+    def test_newlines_advance_line(self):
+        tokens, _ = _scan(b'// c\nvar a\n\nb')
+        self.assertEqual([(t.lexeme, t.line) for t in tokens], [('var', 2), ('a', 2), ('b', 4), ('', 4)])
+
+    def test_crlf_line_endings(self):
+        tokens, error_handler = _scan(b'var a = 1;\r\nprint a;\r\n')
+        self.assertFalse(error_handler.had_error)
+        self.assertEqual([t.line for t in tokens if t.lexeme == 'print'], [2])
+
+    def test_non_ascii_outside_strings(self):
+        cases = [
+            (b'x \xa9 y', 1),
+            (b'x \x80\x80\x80 y', 1),
+            (b'x \xe9 y', 1),
+            (b'\xc3\xa9', 1),
+            (b'\xc3\xa9 \xa9', 2),
+        ]
+        for source, errors in cases:
+            with self.subTest(source=source):
+                stderr = io.StringIO()
+                error_handler = ErrorHandler()
+                with contextlib.redirect_stderr(stderr):
+                    Scanner(source, error_handler=error_handler).scan_tokens()
+                self.assertTrue(error_handler.had_error)
+                self.assertEqual(stderr.getvalue().count("Unexpected character"), errors)
+
+    def test_invalid_utf8_in_string(self):
+        tokens, error_handler = _scan(b'"caf\xc3\xa9" "\xff"')
+        self.assertTrue(error_handler.had_error)
+        self.assertEqual([t.literal for t in tokens], ['caf\xe9', None])
+
+    def test_token_arrays_grow(self):
+        # far more tokens than the initial len(source) // 3 + 16 capacity
+        tokens, _ = _scan(b'(' * 200)
+        self.assertEqual(len(tokens), 201)
+        self.assertEqual(tokens[199].type, TokenType.LEFT_PAREN)
+        self.assertEqual(tokens[200].type, TokenType.EOF)
+
+    def test_token_list_keeps_original_source(self):
+        tokens, _ = _scan(SAMPLE)
+        self.assertEqual(tokens.source, SAMPLE)
+
+    @unittest.skipIf(lox_scan_nb is None, "numba is not installed")
+    def test_numba_scanner_agrees(self):
+        for source in (SAMPLE, SAMPLE.replace(b'\n', b'\r\n'), b'x \xa9\x80 \xc3\xa9\xa9 y', b'', b'(' * 200):
+            with self.subTest(source=source):
+                tokens, error_handler = _scan(source)
+                nb_tokens, nb_error_handler = _scan(source, lox_scan_nb.Scanner)
+                self.assertEqual(nb_tokens.source, tokens.source)
+                self.assertEqual(list(map(repr, nb_tokens)), list(map(repr, tokens)))
+                self.assertEqual(nb_error_handler.had_error, error_handler.had_error)
+
+
+class TokenListTest(unittest.TestCase):
+
+    def test_slice(self):
+        tokens, _ = _scan(b'var a = "s" + 1;')
+        self.assertEqual([t.lexeme for t in tokens[1:3]], ['a', '='])
+        self.assertEqual([t.type for t in tokens[-2:]], [TokenType.SEMICOLON, TokenType.EOF])
+
+    def test_iter_matches_indexing(self):
+        tokens, _ = _scan(b'var a = "s" + 1;')
+        self.assertEqual(list(tokens), [tokens[i] for i in range(len(tokens))])
+
+    def test_views_compare_equal(self):
+        tokens, _ = _scan(b'a "s" 1 a')
+        for index in range(3):
+            self.assertEqual(tokens[index], tokens[index])
+            self.assertIn(tokens[index], tokens)
+            self.assertEqual(tokens.index(tokens[index]), index)
+        self.assertNotEqual(tokens[0], tokens[3])
+
+    def test_fixed_lexeme_tokens_compare_by_position(self):
+        tokens, _ = _scan(b'f(a)(b)')
+        self.assertIs(tokens[4], tokens[4])
+        self.assertNotEqual(tokens[1], tokens[4])
+        self.assertEqual(tokens.index(tokens[4]), 4)
+        self.assertEqual(tokens.count(tokens[1]), 1)
+
+    def test_tokens_are_not_shared(self):
+        tokens, _ = _scan(b'f(a)(b)')
+        tokens[4].line = 99
+        self.assertEqual(tokens[1].line, 1)
+
+    def test_token_types_by_value(self):
+        tokens, _ = _scan(b'( a "s" 1 while')
+        self.assertEqual(
+            [t.type for t in tokens],
+            [TokenType.LEFT_PAREN, TokenType.IDENTIFIER, TokenType.STRING, TokenType.NUMBER, TokenType.WHILE, TokenType.EOF],
+        )
+        self.assertIs(tokens[0].type, TokenType.LEFT_PAREN)
+
+
+if __name__ == '__main__':
+    unittest.main()